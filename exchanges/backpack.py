@@ -308,14 +308,10 @@ class BackpackClient(BaseExchangeClient):
         bids = order_book.get('bids', [])
         asks = order_book.get('asks', [])
 
-        # Sort bids and asks
-        bids = sorted(bids, key=lambda x: Decimal(x[0]), reverse=True)  # (highest price first)
-        asks = sorted(asks, key=lambda x: Decimal(x[0]))                # (lowest price first)
-
         # Best bid is the highest price someone is willing to buy at
-        best_bid = Decimal(bids[0][0]) if bids and len(bids) > 0 else 0
+        best_bid = max(Decimal(bid[0]) for bid in bids) if bids else 0
         # Best ask is the lowest price someone is willing to sell at
-        best_ask = Decimal(asks[0][0]) if asks and len(asks) > 0 else 0
+        best_ask = min(Decimal(ask[0]) for ask in asks) if asks else 0
 
         return best_bid, best_ask
 
@@ -708,7 +708,8 @@ class ExtendedClient(BaseExchangeClient):
                     'ask': asks   # should be list of [{"p": price, "q": quantity}] with a length of 1
                 }
                 
-                self.logger.log(f"Orderbook updated for {market}: bid={bids[0] if bids else 'N/A'}, ask={asks[0] if asks else 'N/A'}", "DEBUG")
+                if self.logger.is_enabled("DEBUG"):
+                    self.logger.log(f"Orderbook updated for {market}: bid={bids[0] if bids else 'N/A'}, ask={asks[0] if asks else 'N/A'}", "DEBUG")
                 
         except asyncio.CancelledError:
             self.logger.log("Orderbook update handler cancelled", "INFO")
@@ -133,9 +133,10 @@ class GrvtClient(BaseExchangeClient):
 
         async def order_update_callback(message: Dict[str, Any]):
             """Handle order updates from WebSocket - match working test implementation."""
-            # Log raw message for debugging
-            self.logger.log(f"Received WebSocket message: {message}", "DEBUG")
-            self.logger.log("**************************************************", "DEBUG")
+            # Log raw message for debugging; skip formatting the payload unless DEBUG is on
+            if self.logger.is_enabled("DEBUG"):
+                self.logger.log(f"Received WebSocket message: {message}", "DEBUG")
+                self.logger.log("**************************************************", "DEBUG")
             try:
                 # Parse the message structure - match the working test implementation exactly
                 if 'feed' in message:
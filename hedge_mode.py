@@ -21,11 +21,24 @@ Cross-platform compatibility:
 """
 
 import asyncio
+import importlib
 import sys
 import argparse
 from decimal import Decimal
 from pathlib import Path
 import dotenv
+from helpers.event_loop import install_uvloop
+
+# Module providing the HedgeBot implementation for each supported exchange
+HEDGE_BOT_MODULES = {
+    'backpack': 'hedge.hedge_mode_bp',
+    'extended': 'hedge.hedge_mode_ext',
+    'apex': 'hedge.hedge_mode_apex',
+    'grvt': 'hedge.hedge_mode_grvt',
+    'edgex': 'hedge.hedge_mode_edgex',
+}
+SUPPORTED_EXCHANGES = tuple(HEDGE_BOT_MODULES)
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -43,7 +56,7 @@ Examples:
     )
     
     parser.add_argument('--exchange', type=str, required=True,
-                        help='Exchange to use (backpack, extended, apex, grvt, or edgex)')
+                        help=f'Exchange to use ({", ".join(SUPPORTED_EXCHANGES)})')
     parser.add_argument('--ticker', type=str, default='BTC',
                         help='Ticker symbol (default: BTC)')
     parser.add_argument('--size', type=str, required=True,
@@ -64,33 +77,21 @@ Examples:
 
 def validate_exchange(exchange):
     """Validate that the exchange is supported."""
-    supported_exchanges = ['backpack', 'extended', 'apex', 'grvt', 'edgex']
-    if exchange.lower() not in supported_exchanges:
+    if exchange.lower() not in SUPPORTED_EXCHANGES:
         print(f"Error: Unsupported exchange '{exchange}'")
-        print(f"Supported exchanges: {', '.join(supported_exchanges)}")
+        print(f"Supported exchanges: {', '.join(SUPPORTED_EXCHANGES)}")
         sys.exit(1)
 
 
 def get_hedge_bot_class(exchange):
     """Import and return the appropriate HedgeBot class."""
+    module_path = HEDGE_BOT_MODULES.get(exchange.lower())
+    if module_path is None:
+        raise ValueError(f"Unsupported exchange: {exchange}")
+
     try:
-        if exchange.lower() == 'backpack':
-            from hedge.hedge_mode_bp import HedgeBot
-            return HedgeBot
-        elif exchange.lower() == 'extended':
-            from hedge.hedge_mode_ext import HedgeBot
-            return HedgeBot
-        elif exchange.lower() == 'apex':
-            from hedge.hedge_mode_apex import HedgeBot
-            return HedgeBot
-        elif exchange.lower() == 'grvt':
-            from hedge.hedge_mode_grvt import HedgeBot
-            return HedgeBot
-        elif exchange.lower() == 'edgex':
-            from hedge.hedge_mode_edgex import HedgeBot
-            return HedgeBot
-        else:
-            raise ValueError(f"Unsupported exchange: {exchange}")
+        # Only the selected exchange's implementation (and its SDKs) is imported
+        return importlib.import_module(module_path).HedgeBot
     except ImportError as e:
         print(f"Error importing hedge mode implementation: {e}")
         sys.exit(1)
@@ -155,4 +156,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
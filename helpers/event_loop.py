@@ -0,0 +1,17 @@
+"""
+Event loop selection shared by the bot entry points.
+"""
+
+import asyncio
+import sys
+
+
+def install_uvloop():
+    """Use uvloop's libuv-based event loop where available; fall back to the default loop."""
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
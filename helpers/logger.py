@@ -9,6 +9,13 @@ from datetime import datetime
 import pytz
 from decimal import Decimal
 
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 
 class TradingLogger:
     """Enhanced logging with structured output and error handling."""
@@ -16,6 +23,8 @@ class TradingLogger:
     def __init__(self, exchange: str, ticker: str, log_to_console: bool = False):
         self.exchange = exchange
         self.ticker = ticker
+        # Message prefix is fixed for the logger's lifetime, so build it once
+        self.prefix = f"[{exchange.upper()}_{ticker.upper()}]"
         # Ensure logs directory exists at the project root
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
         logs_dir = os.path.join(project_root, 'logs')
@@ -79,19 +88,19 @@ class TradingLogger:
 
         return logger
 
+    def is_enabled(self, level: str = "INFO") -> bool:
+        """Check whether a message at the specified level would be emitted.
+
+        Use this to skip building expensive messages on hot paths.
+        """
+        return self.logger.isEnabledFor(LOG_LEVELS.get(level.upper(), logging.INFO))
+
     def log(self, message: str, level: str = "INFO"):
         """Log a message with the specified level."""
-        formatted_message = f"[{self.exchange.upper()}_{self.ticker.upper()}] {message}"
-        if level.upper() == "DEBUG":
-            self.logger.debug(formatted_message)
-        elif level.upper() == "INFO":
-            self.logger.info(formatted_message)
-        elif level.upper() == "WARNING":
-            self.logger.warning(formatted_message)
-        elif level.upper() == "ERROR":
-            self.logger.error(formatted_message)
-        else:
-            self.logger.info(formatted_message)
+        log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(log_level):
+            return
+        self.logger.log(log_level, f"{self.prefix} {message}")
 
     def log_transaction(self, order_id: str, side: str, quantity: Decimal, price: Decimal, status: str):
         """Log a transaction to CSV file."""
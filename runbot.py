@@ -7,11 +7,62 @@ import argparse
 import asyncio
 import logging
 from pathlib import Path
+import signal
 import sys
 import dotenv
-from decimal import Decimal
-from trading_bot import TradingBot, TradingConfig
+from decimal import Decimal, InvalidOperation
 from exchanges import ExchangeFactory
+from helpers.event_loop import install_uvloop
+
+# Resolved once so the parser does not query the factory for both choices and help text
+SUPPORTED_EXCHANGES = tuple(ExchangeFactory.get_supported_exchanges())
+
+# Exchanges whose clients keep per-client signing state (e.g. lighter's SignerClient
+# tracks its own nonce per API key), so several bots cannot share one set of credentials
+SINGLE_TICKER_EXCHANGES = ('lighter',)
+
+
+def decimal_list(value: str):
+    """Parse a comma-separated list of finite decimals for options given per ticker."""
+    try:
+        values = [Decimal(item.strip()) for item in value.split(',')]
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"invalid decimal list: '{value}'")
+    # NaN and Infinity parse as Decimals but cannot be compared or traded with
+    if not all(v.is_finite() for v in values):
+        raise argparse.ArgumentTypeError(f"values must be finite numbers: '{value}'")
+    return values
+
+
+def parse_tickers(value: str):
+    """Split --ticker into upper-cased tickers, rejecting empty and duplicate entries.
+
+    Bots on the same contract would act on each other's order updates, since the
+    order update handler only filters by contract, so each ticker may appear once.
+    """
+    tickers = [ticker.strip().upper() for ticker in value.split(',') if ticker.strip()]
+    if not tickers:
+        print("Error: --ticker must contain at least one ticker")
+        sys.exit(1)
+    if len(set(tickers)) != len(tickers):
+        print(f"Error: --ticker must not repeat a ticker. Tickers: {', '.join(tickers)}")
+        sys.exit(1)
+    return tickers
+
+
+def per_ticker_values(values, tickers, option, unset=None):
+    """Match a per-ticker option to the tickers, one value per ticker.
+
+    A single value is only shared across tickers when it is the option's "unset" default,
+    since quantities are in base units and stop/pause prices are absolute prices.
+    """
+    if len(values) == len(tickers):
+        return values
+    if len(values) == 1 and unset is not None and values[0] == unset:
+        return values * len(tickers)
+    print(f"Error: {option} must give one value per ticker. "
+          f"Tickers: {', '.join(tickers)} | Values: {', '.join(str(v) for v in values)}")
+    sys.exit(1)
 
 
 def parse_arguments():
@@ -20,16 +71,17 @@ def parse_arguments():
 
     # Exchange selection
     parser.add_argument('--exchange', type=str, default='edgex',
-                        choices=ExchangeFactory.get_supported_exchanges(),
+                        choices=SUPPORTED_EXCHANGES,
                         help='Exchange to use (default: edgex). '
-                             f'Available: {", ".join(ExchangeFactory.get_supported_exchanges())}')
+                             f'Available: {", ".join(SUPPORTED_EXCHANGES)}')
 
     # Trading parameters
     parser.add_argument('--ticker', type=str, default='ETH',
-                        help='Ticker (default: ETH)')
-    parser.add_argument('--quantity', type=Decimal, default=Decimal(0.1),
-                        help='Order quantity (default: 0.1)')
-    parser.add_argument('--take-profit', type=Decimal, default=Decimal(0.02),
+                        help='Ticker, or comma-separated tickers to run one bot per ticker (default: ETH)')
+    parser.add_argument('--quantity', type=decimal_list, default=[Decimal('0.1')],
+                        help='Order quantity, comma-separated with one value per ticker '
+                        'when several tickers are given (default: 0.1)')
+    parser.add_argument('--take-profit', type=Decimal, default=Decimal('0.02'),
                         help='Take profit in USDT (default: 0.02)')
     parser.add_argument('--direction', type=str, default='buy', choices=['buy', 'sell'],
                         help='Direction of the bot (default: buy)')
@@ -39,14 +91,18 @@ def parse_arguments():
                         help='Wait time between orders in seconds (default: 450)')
     parser.add_argument('--env-file', type=str, default=".env",
                         help=".env file path (default: .env)")
-    parser.add_argument('--grid-step', type=str, default='-100',
+    parser.add_argument('--grid-step', type=Decimal, default=Decimal('-100'),
                         help='The minimum distance in percentage to the next close order price (default: -100)')
-    parser.add_argument('--stop-price', type=Decimal, default=-1,
+    parser.add_argument('--stop-price', type=decimal_list, default=[Decimal(-1)],
                         help='Price to stop trading and exit. Buy: exits if price >= stop-price.'
-                        'Sell: exits if price <= stop-price. (default: -1, no stop)')
-    parser.add_argument('--pause-price', type=Decimal, default=-1,
+                        'Sell: exits if price <= stop-price. Comma-separated with one value per ticker '
+                        'when several tickers are given, -1 leaves that ticker without a stop; use the = form '
+                        'when the list starts with -1, e.g. --stop-price=-1,5000. (default: -1, no stop)')
+    parser.add_argument('--pause-price', type=decimal_list, default=[Decimal(-1)],
                         help='Pause trading and wait. Buy: pause if price >= pause-price.'
-                        'Sell: pause if price <= pause-price. (default: -1, no pause)')
+                        'Sell: pause if price <= pause-price. Comma-separated with one value per ticker '
+                        'when several tickers are given, -1 leaves that ticker without a pause; use the = form '
+                        'when the list starts with -1, e.g. --pause-price=-1,5000. (default: -1, no pause)')
     parser.add_argument('--boost', action='store_true',
                         help='Use the Boost mode for volume boosting')
 
@@ -96,38 +152,94 @@ async def main():
               f"Current exchange: {args.exchange}")
         sys.exit(1)
 
+    # Values shared by every bot are normalized once
+    direction = args.direction.lower()
+    exchange = args.exchange.lower()
+
+    tickers = parse_tickers(args.ticker)
+    if len(tickers) > 1 and exchange in SINGLE_TICKER_EXCHANGES:
+        print(f"Error: multiple tickers are not supported on {exchange}, its clients cannot share one API key. "
+              f"Run one process per ticker instead.")
+        sys.exit(1)
+
+    quantities = per_ticker_values(args.quantity, tickers, '--quantity')
+    stop_prices = per_ticker_values(args.stop_price, tickers, '--stop-price', unset=Decimal(-1))
+    pause_prices = per_ticker_values(args.pause_price, tickers, '--pause-price', unset=Decimal(-1))
+
+    # Reject order settings the bot cannot trade with before touching the exchange
+    for ticker, quantity in zip(tickers, quantities):
+        if quantity <= 0:
+            print(f"Error: --quantity must be positive. Current quantity for {ticker}: {quantity}")
+            sys.exit(1)
+    if args.max_orders < 1:
+        print(f"Error: --max-orders must be at least 1. Current max orders: {args.max_orders}")
+        sys.exit(1)
+
     env_path = Path(args.env_file)
     if not env_path.exists():
         print(f"Env file not find: {env_path.resolve()}")
         sys.exit(1)
     dotenv.load_dotenv(args.env_file)
 
-    # Create configuration
-    config = TradingConfig(
-        ticker=args.ticker.upper(),
-        contract_id='',  # will be set in the bot's run method
-        tick_size=Decimal(0),
-        quantity=args.quantity,
-        take_profit=args.take_profit,
-        direction=args.direction.lower(),
-        max_orders=args.max_orders,
-        wait_time=args.wait_time,
-        exchange=args.exchange.lower(),
-        grid_step=Decimal(args.grid_step),
-        stop_price=Decimal(args.stop_price),
-        pause_price=Decimal(args.pause_price),
-        boost_mode=args.boost
-    )
-
-    # Create and run the bot
-    bot = TradingBot(config)
+    # Imported lazily so argument and env-file errors exit before the bot's dependencies load
+    from trading_bot import TradingBot, TradingConfig
+
+    # Create one bot per ticker
+    bots = []
+    for ticker, quantity, stop_price, pause_price in zip(tickers, quantities, stop_prices, pause_prices):
+        config = TradingConfig(
+            ticker=ticker,
+            contract_id='',  # will be set in the bot's run method
+            tick_size=Decimal(0),
+            quantity=quantity,
+            take_profit=args.take_profit,
+            direction=direction,
+            max_orders=args.max_orders,
+            wait_time=args.wait_time,
+            exchange=exchange,
+            grid_step=args.grid_step,
+            stop_price=stop_price,
+            pause_price=pause_price,
+            boost_mode=args.boost
+        )
+        bots.append(TradingBot(config))
+
+    # Run the bots concurrently so one bot's network waits overlap with the others
+    tasks = [asyncio.ensure_future(bot.run()) for bot in bots]
+    sigterm_received = False
+
+    def request_shutdown():
+        nonlocal sigterm_received
+        # A bot waiting on an open order only sees the flag once that order resolves, so a
+        # repeated signal cancels the tasks; run() still disconnects in its finally block
+        if sigterm_received:
+            for bot in bots:
+                bot.logger.log("Received SIGTERM again, cancelling the bot", "WARNING")
+            for task in tasks:
+                task.cancel()
+            return
+
+        sigterm_received = True
+        for bot in bots:
+            bot.logger.log("Received SIGTERM, shutting down after the current step", "WARNING")
+            bot.shutdown_requested = True
+
+    # Stop cleanly on SIGTERM (docker/systemd): each bot leaves its main loop and
+    # run() disconnects from the exchange, instead of the process being killed mid-order
     try:
-        await bot.run()
-    except Exception as e:
-        print(f"Bot execution failed: {e}")
-        # The bot's run method already handles graceful shutdown
-        return
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, request_shutdown)
+    except NotImplementedError:
+        # Signal handlers are not supported by the Windows event loop
+        pass
+
+    # return_exceptions keeps a failing bot from cancelling its siblings
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for bot, result in zip(bots, results):
+        if isinstance(result, Exception):
+            # The bot's run method already handles graceful shutdown
+            print(f"Bot execution failed [{bot.config.ticker}]: {result}")
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+from decimal import Decimal
+from runbot import decimal_list, parse_tickers, per_ticker_values
+
+
+def exits(func, *args, **kwargs):
+    """Return True if func exits through sys.exit, as runbot does on invalid arguments."""
+    try:
+        func(*args, **kwargs)
+    except SystemExit:
+        return True
+    return False
+
+
+def rejects(value):
+    """Return True if decimal_list rejects value as an argparse type error."""
+    try:
+        decimal_list(value)
+    except argparse.ArgumentTypeError:
+        return True
+    return False
+
+
+# decimal_list: 逗号分隔的数值列表
+def test_decimal_list_parses_values():
+    assert decimal_list("0.01, 0.1") == [Decimal("0.01"), Decimal("0.1")]
+    assert decimal_list("-1,5000") == [Decimal(-1), Decimal(5000)]
+
+
+def test_decimal_list_rejects_bad_token():
+    assert rejects("0.1,x")
+    assert rejects("0.1,")
+
+
+def test_decimal_list_rejects_non_finite():
+    assert rejects("nan")
+    assert rejects("0.1,inf")
+    assert rejects("-Infinity")
+
+
+# parse_tickers: 标的列表
+def test_parse_tickers_normalizes():
+    assert parse_tickers(" btc, ETH ") == ["BTC", "ETH"]
+
+
+def test_parse_tickers_rejects_empty_and_duplicates():
+    assert exits(parse_tickers, " , ")
+    assert exits(parse_tickers, "ETH,eth")
+    assert exits(parse_tickers, "BTC,BTC")
+
+
+# per_ticker_values: 按标的匹配参数
+def test_per_ticker_values_one_per_ticker():
+    values = [Decimal("0.01"), Decimal("0.1")]
+    assert per_ticker_values(values, ["BTC", "ETH"], "--quantity") == values
+
+
+def test_per_ticker_values_single_ticker():
+    assert per_ticker_values([Decimal("0.1")], ["ETH"], "--quantity") == [Decimal("0.1")]
+
+
+def test_per_ticker_values_shares_unset_default():
+    unset = Decimal(-1)
+    assert per_ticker_values([unset], ["BTC", "ETH"], "--stop-price", unset=unset) == [unset, unset]
+
+
+def test_per_ticker_values_rejects_count_mismatch():
+    # 数量和绝对价格不能在多个标的间共用
+    assert exits(per_ticker_values, [Decimal("0.1")], ["BTC", "ETH"], "--quantity")
+    assert exits(per_ticker_values, [Decimal(5500)], ["BTC", "ETH"], "--stop-price", unset=Decimal(-1))
+    assert exits(per_ticker_values, [Decimal(1), Decimal(2), Decimal(3)], ["BTC", "ETH"], "--quantity")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from types import SimpleNamespace
+from unittest.mock import patch
+from trading_bot import TradingBot
+
+
+def make_bot(active_close_orders=0, last_open_order_time=None):
+    """Build a TradingBot with only the state _calculate_wait_time reads, without an exchange client."""
+    bot = object.__new__(TradingBot)
+    bot.config = SimpleNamespace(wait_time=450, max_orders=40)
+    bot.active_close_orders = [{'id': str(i), 'price': 0, 'size': 0} for i in range(active_close_orders)]
+    bot.last_close_orders = active_close_orders
+    bot.last_open_order_time = last_open_order_time
+    return bot
+
+
+# 刚开机时 monotonic 时钟很小，不能被当成“很久以前下过单”
+def test_never_opened_without_close_orders_does_not_wait():
+    bot = make_bot()
+    with patch('trading_bot.time.monotonic', return_value=60.0):
+        assert bot._calculate_wait_time() == 0
+    assert bot.last_open_order_time is None
+
+
+def test_never_opened_with_close_orders_starts_cooldown():
+    bot = make_bot(active_close_orders=1)
+    with patch('trading_bot.time.monotonic', return_value=60.0):
+        assert bot._calculate_wait_time() == 1
+    assert bot.last_open_order_time == 60.0
+
+
+def test_cooldown_window():
+    # 1/40 的订单占比使用 wait_time / 4 的冷却时间
+    cool_down_time = 450 / 4
+    bot = make_bot(active_close_orders=1, last_open_order_time=1000.0)
+    with patch('trading_bot.time.monotonic', return_value=1000.0 + cool_down_time - 1):
+        assert bot._calculate_wait_time() == 1
+    with patch('trading_bot.time.monotonic', return_value=1000.0 + cool_down_time + 1):
+        assert bot._calculate_wait_time() == 0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
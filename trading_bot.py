@@ -73,15 +73,26 @@ class TradingBot:
 
         # Trading state
         self.active_close_orders = []
+        self.active_close_amount = Decimal(0)
         self.last_close_orders = 0
-        self.last_open_order_time = 0
-        self.last_log_time = 0
+        # Monotonic timestamps; None means the event has not happened yet
+        self.last_open_order_time = None
+        self.last_log_time = None
+        self.last_traceback_log_time = None
         self.current_order_status = None
+        self.order_filled_amount = 0.0
         self.order_filled_event = asyncio.Event()
         self.order_canceled_event = asyncio.Event()
         self.shutdown_requested = False
         self.loop = None
 
+        # Price multipliers derived from the config, computed once instead of per order
+        if config.close_order_side == 'sell':
+            self.close_price_multiplier = 1 + config.take_profit / 100
+        else:
+            self.close_price_multiplier = 1 - config.take_profit / 100
+        self.grid_step_multiplier = 1 + config.grid_step / 100
+
         # Register order callback
         self._setup_websocket_handlers()
 
@@ -111,13 +122,12 @@ class TradingBot:
                 status = message.get('status')
                 side = message.get('side', '')
                 order_type = message.get('order_type', '')
-                filled_size = Decimal(message.get('filled_size'))
                 if order_type == "OPEN":
                     self.current_order_status = status
 
                 if status == 'FILLED':
                     if order_type == "OPEN":
-                        self.order_filled_amount = filled_size
+                        self.order_filled_amount = Decimal(message.get('filled_size'))
                         # Ensure thread-safe interaction with asyncio event loop
                         if self.loop is not None:
                             self.loop.call_soon_threadsafe(self.order_filled_event.set)
@@ -129,6 +139,7 @@ class TradingBot:
                                     f"{message.get('size')} @ {message.get('price')}", "INFO")
                     self.logger.log_transaction(order_id, side, message.get('size'), message.get('price'), status)
                 elif status == "CANCELED":
+                    filled_size = Decimal(message.get('filled_size'))
                     if order_type == "OPEN":
                         self.order_filled_amount = filled_size
                         if self.loop is not None:
@@ -148,14 +159,19 @@ class TradingBot:
                                         f"{message.get('size')} @ {message.get('price')}", "INFO")
                 elif status == "PARTIALLY_FILLED":
                     self.logger.log(f"[{order_type}] [{order_id}] {status} "
-                                    f"{filled_size} @ {message.get('price')}", "INFO")
+                                    f"{message.get('filled_size')} @ {message.get('price')}", "INFO")
                 else:
                     self.logger.log(f"[{order_type}] [{order_id}] {status} "
                                     f"{message.get('size')} @ {message.get('price')}", "INFO")
 
             except Exception as e:
                 self.logger.log(f"Error handling order update: {e}", "ERROR")
-                self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+                # Format the traceback at most every 10s so a stream of malformed messages
+                # does not spend the websocket callback on traceback formatting
+                now = time.monotonic()
+                if self.last_traceback_log_time is None or now - self.last_traceback_log_time > 10:
+                    self.last_traceback_log_time = now
+                    self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
 
         # Setup order update handler
         self.exchange_client.setup_order_update_handler(order_update_handler)
@@ -164,28 +180,34 @@ class TradingBot:
         """Calculate wait time between orders."""
         cool_down_time = self.config.wait_time
 
-        if len(self.active_close_orders) < self.last_close_orders:
-            self.last_close_orders = len(self.active_close_orders)
+        active_count = len(self.active_close_orders)
+        if active_count < self.last_close_orders:
+            self.last_close_orders = active_count
             return 0
 
-        self.last_close_orders = len(self.active_close_orders)
-        if len(self.active_close_orders) >= self.config.max_orders:
+        self.last_close_orders = active_count
+        if active_count >= self.config.max_orders:
             return 1
 
-        if len(self.active_close_orders) / self.config.max_orders >= 2/3:
+        fill_ratio = active_count / self.config.max_orders
+        if fill_ratio >= 2/3:
             cool_down_time = 2 * self.config.wait_time
-        elif len(self.active_close_orders) / self.config.max_orders >= 1/3:
+        elif fill_ratio >= 1/3:
             cool_down_time = self.config.wait_time
-        elif len(self.active_close_orders) / self.config.max_orders >= 1/6:
+        elif fill_ratio >= 1/6:
             cool_down_time = self.config.wait_time / 2
         else:
             cool_down_time = self.config.wait_time / 4
 
         # if the program detects active_close_orders during startup, it is necessary to consider cooldown_time
-        if self.last_open_order_time == 0 and len(self.active_close_orders) > 0:
-            self.last_open_order_time = time.time()
+        if self.last_open_order_time is None and active_count > 0:
+            self.last_open_order_time = time.monotonic()
 
-        if time.time() - self.last_open_order_time > cool_down_time:
+        # No order has been opened yet, so there is no cooldown to wait for
+        if self.last_open_order_time is None:
+            return 0
+
+        if time.monotonic() - self.last_open_order_time > cool_down_time:
             return 0
         else:
             return 1
@@ -237,13 +259,10 @@ class TradingBot:
                     self.config.close_order_side
                 )
             else:
-                self.last_open_order_time = time.time()
+                self.last_open_order_time = time.monotonic()
                 # Place close order
                 close_side = self.config.close_order_side
-                if close_side == 'sell':
-                    close_price = filled_price * (1 + self.config.take_profit/100)
-                else:
-                    close_price = filled_price * (1 - self.config.take_profit/100)
+                close_price = filled_price * self.close_price_multiplier
 
                 close_order_result = await self.exchange_client.place_close_order(
                     self.config.contract_id,
@@ -295,8 +314,8 @@ class TradingBot:
             self.logger.log(f"[OPEN] [{order_id}] Cancelling order and placing a new order", "INFO")
             if self.config.exchange == "lighter":
                 cancel_result = await self.exchange_client.cancel_order(order_id)
-                start_time = time.time()
-                while (time.time() - start_time < 10 and self.exchange_client.current_order.status != 'CANCELED' and
+                start_time = time.monotonic()
+                while (time.monotonic() - start_time < 10 and self.exchange_client.current_order.status != 'CANCELED' and
                         self.exchange_client.current_order.status != 'FILLED'):
                     await asyncio.sleep(0.1)
 
@@ -338,10 +357,7 @@ class TradingBot:
                         close_side
                     )
                 else:
-                    if close_side == 'sell':
-                        close_price = filled_price * (1 + self.config.take_profit/100)
-                    else:
-                        close_price = filled_price * (1 - self.config.take_profit/100)
+                    close_price = filled_price * self.close_price_multiplier
 
                     close_order_result = await self.exchange_client.place_close_order(
                         self.config.contract_id,
@@ -352,7 +368,7 @@ class TradingBot:
                     if self.config.exchange == "lighter":
                         await asyncio.sleep(1)
 
-                self.last_open_order_time = time.time()
+                self.last_open_order_time = time.monotonic()
                 if not close_order_result.success:
                     self.logger.log(f"[CLOSE] Failed to place close order: {close_order_result.error_message}", "ERROR")
 
@@ -360,46 +376,39 @@ class TradingBot:
 
         return False
 
+    def _update_active_close_orders(self, active_orders):
+        """Collect close orders and their total size in a single pass over active orders."""
+        self.active_close_orders = []
+        self.active_close_amount = Decimal(0)
+        for order in active_orders:
+            if order.side == self.config.close_order_side:
+                self.active_close_orders.append({
+                    'id': order.order_id,
+                    'price': order.price,
+                    'size': order.size
+                })
+                self.active_close_amount += Decimal(order.size)
+
     async def _log_status_periodically(self):
         """Log status information periodically, including positions."""
-        if time.time() - self.last_log_time > 60 or self.last_log_time == 0:
+        if self.last_log_time is None or time.monotonic() - self.last_log_time > 60:
             print("--------------------------------")
             try:
-                # Get active orders
-                active_orders = await self.exchange_client.get_active_orders(self.config.contract_id)
-
-                # Filter close orders
-                self.active_close_orders = []
-                for order in active_orders:
-                    if order.side == self.config.close_order_side:
-                        self.active_close_orders.append({
-                            'id': order.order_id,
-                            'price': order.price,
-                            'size': order.size
-                        })
-
-                # Get positions
+                # Get positions; close orders were already refreshed by the main loop
                 position_amt = await self.exchange_client.get_account_positions()
                 position_amt = abs(position_amt)
 
-                # Calculate active closing amount
-                active_close_amount = sum(
-                    Decimal(order.get('size', 0))
-                    for order in self.active_close_orders
-                    if isinstance(order, dict)
-                )
-
-                self.logger.log(f"Current Position: {position_amt} | Active closing amount: {active_close_amount} | "
+                self.logger.log(f"Current Position: {position_amt} | Active closing amount: {self.active_close_amount} | "
                                 f"Order quantity: {len(self.active_close_orders)}")
-                self.last_log_time = time.time()
+                self.last_log_time = time.monotonic()
                 # Check for position mismatch
-                if abs(position_amt - active_close_amount) > (2 * self.config.quantity):
+                if abs(position_amt - self.active_close_amount) > (2 * self.config.quantity):
                     error_message = f"\n\nERROR: [{self.config.exchange.upper()}_{self.config.ticker.upper()}] "
                     error_message += "Position mismatch detected\n"
                     error_message += "###### ERROR ###### ERROR ###### ERROR ###### ERROR #####\n"
                     error_message += "Please manually rebalance your position and take-profit orders\n"
                     error_message += "请手动平衡当前仓位和正在关闭的仓位\n"
-                    error_message += f"current position: {position_amt} | active closing amount: {active_close_amount} | "f"Order quantity: {len(self.active_close_orders)}\n"
+                    error_message += f"current position: {position_amt} | active closing amount: {self.active_close_amount} | "f"Order quantity: {len(self.active_close_orders)}\n"
                     error_message += "###### ERROR ###### ERROR ###### ERROR ###### ERROR #####\n"
                     self.logger.log(error_message, "ERROR")
 
@@ -431,14 +440,14 @@ class TradingBot:
                 raise ValueError("No bid/ask data available")
 
             if self.config.direction == "buy":
-                new_order_close_price = best_ask * (1 + self.config.take_profit/100)
-                if next_close_price / new_order_close_price > 1 + self.config.grid_step/100:
+                new_order_close_price = best_ask * self.close_price_multiplier
+                if next_close_price / new_order_close_price > self.grid_step_multiplier:
                     return True
                 else:
                     return False
             elif self.config.direction == "sell":
-                new_order_close_price = best_bid * (1 - self.config.take_profit/100)
-                if new_order_close_price / next_close_price > 1 + self.config.grid_step/100:
+                new_order_close_price = best_bid * self.close_price_multiplier
+                if new_order_close_price / next_close_price > self.grid_step_multiplier:
                     return True
                 else:
                     return False
@@ -485,8 +494,13 @@ class TradingBot:
         telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
         telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
         if telegram_token and telegram_chat_id:
-            with TelegramBot(telegram_token, telegram_chat_id) as tg_bot:
-                tg_bot.send_text(message)
+            # TelegramBot uses blocking requests; send from a worker thread so the
+            # event loop keeps servicing websocket callbacks meanwhile
+            def send_telegram():
+                with TelegramBot(telegram_token, telegram_chat_id) as tg_bot:
+                    tg_bot.send_text(message)
+
+            await asyncio.get_running_loop().run_in_executor(None, send_telegram)
 
     async def run(self):
         """Main trading loop."""
@@ -523,14 +537,7 @@ class TradingBot:
                 active_orders = await self.exchange_client.get_active_orders(self.config.contract_id)
 
                 # Filter close orders
-                self.active_close_orders = []
-                for order in active_orders:
-                    if order.side == self.config.close_order_side:
-                        self.active_close_orders.append({
-                            'id': order.order_id,
-                            'price': order.price,
-                            'size': order.size
-                        })
+                self._update_active_close_orders(active_orders)
 
                 # Periodic logging
                 mismatch_detected = await self._log_status_periodically()